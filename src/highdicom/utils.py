@@ -1,5 +1,15 @@
+import functools
 import itertools
-from typing import Iterator, List, Optional, Tuple
+import math
+from typing import (
+    Callable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import numpy as np
 from pydicom.dataset import Dataset
@@ -225,28 +235,953 @@ def compute_plane_position_slide_per_frame(
         1.0
     )
 
-    return [
-        compute_plane_position_tiled_full(
-            row_index=r,
-            column_index=c,
-            x_offset=image_origin.XOffsetInSlideCoordinateSystem,
-            y_offset=image_origin.YOffsetInSlideCoordinateSystem,
-            rows=dataset.Rows,
-            columns=dataset.Columns,
-            image_orientation=image_orientation,
-            pixel_spacing=pixel_spacing,
-            slice_thickness=slice_thickness,
-            spacing_between_slices=spacing_between_slices,
-            slice_index=s,
-        )
-        for c, r, s in itertools.product(
+    x_offset = image_origin.XOffsetInSlideCoordinateSystem
+    y_offset = image_origin.YOffsetInSlideCoordinateSystem
+
+    # The orientation, pixel spacing and (X, Y) offset are shared by all
+    # frames, so the affine transformation is built only once per focal
+    # plane and applied to the pixel matrix offsets of all tiles in a
+    # single batch rather than once per frame.
+    tile_indices = list(
+        itertools.product(
             row_direction,  # left to right, increasing Column index
             column_direction,  # top to bottom, increasing Row index
-            depth_direction
+        )
+    )
+    # Offset values are one-based, i.e., the top left pixel in the Total
+    # Pixel Matrix has offset (1, 1) rather than (0, 0)
+    pixel_offsets = np.array(
+        [
+            [
+                ((c - 1) * dataset.Columns) + 1,
+                ((r - 1) * dataset.Rows) + 1,
+            ]
+            for c, r in tile_indices
+        ],
+        dtype=float
+    )
+
+    physical_offsets = []
+    for s in depth_direction:
+        z_offset = (
+            s * slice_thickness +
+            s * spacing_between_slices
+        )
+        affine = build_transform(
+            image_position=(x_offset, y_offset, z_offset),
+            image_orientation=image_orientation,
+            pixel_spacing=pixel_spacing
+        )
+        physical = apply_transform_batch(pixel_offsets, affine)
+        if physical[:, 0].min() < 0.0:
+            raise ValueError(
+                'X offset in coordinate system cannot be negative.'
+            )
+        if physical[:, 1].min() < 0.0:
+            raise ValueError(
+                'Y offset in coordinate system cannot be negative.'
+            )
+        if physical[:, 2].min() < 0.0:
+            raise ValueError(
+                'Z offset in coordinate system cannot be negative.'
+            )
+        physical_offsets.append(physical)
+
+    return [
+        PlanePositionSequence(
+            coordinate_system=CoordinateSystemNames.SLIDE,
+            image_position=(
+                physical_offsets[s][i, 0],
+                physical_offsets[s][i, 1],
+                physical_offsets[s][i, 2],
+            ),
+            pixel_matrix_position=(
+                int(pixel_offsets[i, 1]),
+                int(pixel_offsets[i, 0]),
+            )
+        )
+        for i, s in itertools.product(
+            range(len(tile_indices)),
+            range(num_focal_planes)
         )
     ]
 
 
+# Orientation of axis-aligned images (e.g., most CT and MR acquisitions),
+# for which the rotation matrix reduces to a diagonal and the cross product
+# can be skipped entirely.
+_AXIS_ALIGNED_ORIENTATION = (1.0, 0.0, 0.0, 0.0, 1.0, 0.0)
+
+# Tolerance for deciding whether an image plane is parallel to the plane
+# spanned by the X and Y axis of the frame of reference. A strict
+# comparison with zero would reject orientations whose Z components carry
+# floating-point drift from upstream computations.
+_PLANARITY_TOLERANCE = 1e-12
+
+
+@functools.lru_cache(maxsize=128)
+def _create_rotation_matrix_cached(
+    image_orientation: Tuple[float, ...]
+) -> np.ndarray:
+    """Builds a rotation matrix for a given image orientation and caches it.
+
+    A series typically contains only a handful of distinct orientations
+    (often exactly one), so the matrix is built once per orientation and
+    reused. The returned array is marked read-only, since it is shared
+    between all callers; callers that need to modify it must copy it first.
+
+    Parameters
+    ----------
+    image_orientation: Tuple[float, ...]
+        Cosines of the row direction (first triplet) and the column
+        direction (second triplet) for X, Y, and Z axis of the patient or
+        slide coordinate system defined by the Frame of Reference
+
+    Returns
+    -------
+    numpy.ndarray
+        Read-only 3 x 3 rotation matrix
+
+    Raises
+    ------
+    ValueError
+        When `image_orientation` does not have length 6
+
+    """
+    if len(image_orientation) != 6:
+        raise ValueError('Argument "image_orientation" must have length 6.')
+    row_cosines = np.array(image_orientation[:3], dtype=float)
+    column_cosines = np.array(image_orientation[3:], dtype=float)
+    rotation = np.empty((3, 3))
+    rotation[:, 0] = row_cosines
+    rotation[:, 1] = column_cosines
+    rotation[:, 2] = np.cross(column_cosines, row_cosines)
+    rotation.setflags(write=False)
+    return rotation
+
+
+def create_rotation_matrix(
+    image_orientation: Sequence[float]
+) -> np.ndarray:
+    """Builds a rotation matrix from the orientation of an image plane with
+    respect to the frame of reference.
+
+    Parameters
+    ----------
+    image_orientation: Sequence[float]
+        Cosines of the row direction (first triplet: horizontal, left to
+        right, increasing Column index) and the column direction (second
+        triplet: vertical, top to bottom, increasing Row index) direction
+        for X, Y, and Z axis of the patient or slide coordinate system
+        defined by the Frame of Reference
+
+    Returns
+    -------
+    numpy.ndarray
+        3 x 3 rotation matrix, whose first and second columns are the
+        direction cosines of the row and column direction, respectively,
+        and whose third column is the normal of the image plane
+
+    Raises
+    ------
+    ValueError
+        When `image_orientation` does not have length 6
+
+    """
+    rotation = _create_rotation_matrix_cached(
+        tuple(float(v) for v in image_orientation)
+    )
+    return rotation.copy()
+
+
+def compute_rotation(
+    image_orientation: Sequence[float],
+    in_degrees: bool = False
+) -> float:
+    """Computes the rotation of the pixel matrix of an image about the
+    normal of the image plane with respect to the X axis of the frame of
+    reference.
+
+    The angle is computed directly from the direction cosines; only two of
+    the entries of the rotation matrix contribute to it, so the matrix is
+    never built.
+
+    Parameters
+    ----------
+    image_orientation: Sequence[float]
+        Cosines of the row direction (first triplet: horizontal, left to
+        right, increasing Column index) and the column direction (second
+        triplet: vertical, top to bottom, increasing Row index) direction
+        for X, Y, and Z axis of the patient or slide coordinate system
+        defined by the Frame of Reference
+    in_degrees: bool, optional
+        Whether the angle should be returned in degrees rather than radians
+
+    Returns
+    -------
+    float
+        Rotation angle
+
+    Raises
+    ------
+    ValueError
+        When the image plane is not parallel to the plane spanned by the X
+        and Y axis of the frame of reference, i.e., when the pixel matrix
+        is rotated about an axis other than the Z axis, or when the normal
+        of the image plane points into the negative Z direction
+
+    """
+    if len(image_orientation) != 6:
+        raise ValueError('Argument "image_orientation" must have length 6.')
+    # Single branchless magnitude check instead of two separate comparisons
+    # of the Z components with zero.
+    if (
+        abs(image_orientation[2]) + abs(image_orientation[5])
+    ) > _PLANARITY_TOLERANCE:
+        raise ValueError(
+            'Pixel matrix must be rotated about the Z axis of the frame '
+            'of reference.'
+        )
+    # Z component of the cross product of the column and the row direction,
+    # i.e., the bottom right entry of the rotation matrix.
+    normal_z = (
+        image_orientation[3] * image_orientation[1] -
+        image_orientation[4] * image_orientation[0]
+    )
+    if normal_z < 0.0:
+        raise ValueError(
+            'Normal of the image plane must point into the positive Z '
+            'direction of the frame of reference.'
+        )
+    angle = math.atan2(-image_orientation[3], image_orientation[0])
+    if in_degrees:
+        return math.degrees(angle)
+    return angle
+
+
+def compute_rotations(
+    image_orientations: Union[Sequence[Sequence[float]], np.ndarray],
+    in_degrees: bool = False
+) -> np.ndarray:
+    """Computes the rotation of the pixel matrix for multiple image planes
+    in a single vectorized pass.
+
+    The result is equivalent to calling :func:`compute_rotation` once per
+    plane, but both the validation checks and the angle computation are
+    performed array-wise across all planes, avoiding per-plane Python
+    dispatch when checking the orientations of an entire series.
+
+    Parameters
+    ----------
+    image_orientations: Union[Sequence[Sequence[float]], numpy.ndarray]
+        Cosines of the row direction (first triplet) and the column
+        direction (second triplet) of each image plane with shape
+        ``(n, 6)``
+    in_degrees: bool, optional
+        Whether the angles should be returned in degrees rather than
+        radians
+
+    Returns
+    -------
+    numpy.ndarray
+        Rotation angles with shape ``(n, )``
+
+    Raises
+    ------
+    ValueError
+        When `image_orientations` does not have shape ``(n, 6)``, when any
+        image plane is not parallel to the plane spanned by the X and Y
+        axis of the frame of reference, or when the normal of any image
+        plane points into the negative Z direction
+
+    """
+    orientations = np.asarray(image_orientations, dtype=float)
+    if orientations.ndim != 2 or orientations.shape[1] != 6:
+        raise ValueError(
+            'Argument "image_orientations" must have shape (n, 6).'
+        )
+    planarity = np.abs(orientations[:, 2]) + np.abs(orientations[:, 5])
+    if np.any(planarity > _PLANARITY_TOLERANCE):
+        raise ValueError(
+            'Pixel matrices must be rotated about the Z axis of the frame '
+            'of reference.'
+        )
+    normal_z = (
+        orientations[:, 3] * orientations[:, 1] -
+        orientations[:, 4] * orientations[:, 0]
+    )
+    if np.any(normal_z < 0.0):
+        raise ValueError(
+            'Normals of the image planes must point into the positive Z '
+            'direction of the frame of reference.'
+        )
+    angles = np.arctan2(-orientations[:, 3], orientations[:, 0])
+    if in_degrees:
+        return np.degrees(angles)
+    return angles
+
+
+def build_transform(
+    image_position: Sequence[float],
+    image_orientation: Sequence[float],
+    pixel_spacing: Sequence[float],
+    dtype: Union[type, np.dtype] = np.float64
+) -> np.ndarray:
+    """Builds an affine transformation matrix for mapping coordinates in the
+    pixel matrix of an image into the frame of reference.
+
+    Parameters
+    ----------
+    image_position: Sequence[float]
+        Position of the slice (image or frame) in the Frame of Reference,
+        i.e., the offset of the top left pixel in the pixel matrix from the
+        origin of the reference coordinate system along the X, Y, and Z axis
+    image_orientation: Sequence[float]
+        Cosines of the row direction (first triplet: horizontal, left to
+        right, increasing Column index) and the column direction (second
+        triplet: vertical, top to bottom, increasing Row index) direction
+        for X, Y, and Z axis of the patient or slide coordinate system
+        defined by the Frame of Reference
+    pixel_spacing: Sequence[float]
+        Spacing between pixels in millimeter unit along the row direction
+        (horizontal, left to right, increasing Column index) and the column
+        direction (vertical, top to bottom, increasing Row index)
+    dtype: Union[type, numpy.dtype], optional
+        Data type of the output array; double precision is used by default,
+        single precision can be requested to halve the memory bandwidth
+        when the matrix is applied to a large number of coordinates
+
+    Returns
+    -------
+    numpy.ndarray
+        4 x 4 affine transformation matrix
+
+    Raises
+    ------
+    ValueError
+        When `image_position`, `image_orientation` or `pixel_spacing` do
+        not have the expected length
+
+    """
+    # Read the below article for further information about the mapping
+    # between coordinates in the pixel matrix and the frame of reference:
+    # https://nipy.org/nibabel/dicom/dicom_orientation.html
+    if len(image_position) != 3:
+        raise ValueError('Argument "image_position" must have length 3.')
+    if len(pixel_spacing) != 2:
+        raise ValueError('Argument "pixel_spacing" must have length 2.')
+    translation = np.asarray(image_position, dtype=np.float64)
+    spacing = np.asarray(pixel_spacing, dtype=np.float64)
+
+    orientation_key = tuple(float(v) for v in image_orientation)
+    affine = np.zeros((4, 4), dtype=dtype)
+    if orientation_key == _AXIS_ALIGNED_ORIENTATION:
+        # Specialized path for the by far most common orientation: the
+        # matrix is diagonal plus translation, so the rotation matrix does
+        # not need to be built at all.
+        affine[0, 0] = spacing[0]
+        affine[1, 1] = spacing[1]
+        affine[2, 2] = -1.0
+    else:
+        rotation = _create_rotation_matrix_cached(orientation_key)
+        affine[:3, :3] = rotation
+        affine[:3, 0] *= spacing[0]
+        affine[:3, 1] *= spacing[1]
+    affine[:3, 3] = translation
+    affine[3, 3] = 1.0
+    return affine
+
+
+def build_transforms(
+    image_positions: Sequence[Sequence[float]],
+    image_orientations: Sequence[Sequence[float]],
+    pixel_spacings: Sequence[Sequence[float]],
+    dtype: Union[type, np.dtype] = np.float64
+) -> np.ndarray:
+    """Builds affine transformation matrices for multiple image planes in
+    a single vectorized pass.
+
+    The result is equivalent to calling :func:`build_transform` once per
+    plane, but the cost of constructing the matrices is amortized across
+    all planes, which is considerably faster when mapping coordinates for
+    all frames of a multi-frame image.
+
+    Parameters
+    ----------
+    image_positions: Sequence[Sequence[float]]
+        Position of each slice (image or frame) in the Frame of Reference
+        with shape ``(n, 3)``
+    image_orientations: Sequence[Sequence[float]]
+        Cosines of the row direction and the column direction of each slice
+        with shape ``(n, 6)``
+    pixel_spacings: Sequence[Sequence[float]]
+        Spacing between pixels of each slice along the row and the column
+        direction with shape ``(n, 2)``
+    dtype: Union[type, numpy.dtype], optional
+        Data type of the output array; double precision is used by default
+
+    Returns
+    -------
+    numpy.ndarray
+        Stack of 4 x 4 affine transformation matrices with shape
+        ``(n, 4, 4)``
+
+    Raises
+    ------
+    ValueError
+        When arguments do not have the expected shape or when they do not
+        have matching number of rows
+
+    """
+    image_positions = np.array(image_positions, dtype=dtype)
+    image_orientations = np.array(image_orientations, dtype=dtype)
+    pixel_spacings = np.array(pixel_spacings, dtype=dtype)
+    if image_positions.ndim != 2 or image_positions.shape[1] != 3:
+        raise ValueError(
+            'Argument "image_positions" must have shape (n, 3).'
+        )
+    if image_orientations.ndim != 2 or image_orientations.shape[1] != 6:
+        raise ValueError(
+            'Argument "image_orientations" must have shape (n, 6).'
+        )
+    if pixel_spacings.ndim != 2 or pixel_spacings.shape[1] != 2:
+        raise ValueError(
+            'Argument "pixel_spacings" must have shape (n, 2).'
+        )
+    n_planes = image_positions.shape[0]
+    if (image_orientations.shape[0] != n_planes or
+            pixel_spacings.shape[0] != n_planes):
+        raise ValueError(
+            'Arguments "image_positions", "image_orientations" and '
+            '"pixel_spacings" must have the same number of rows.'
+        )
+
+    row_cosines = image_orientations[:, :3]
+    column_cosines = image_orientations[:, 3:]
+    normals = np.cross(column_cosines, row_cosines)
+    rotations = np.stack([row_cosines, column_cosines, normals], axis=-1)
+    rotations[:, :, 0] *= pixel_spacings[:, 0:1]
+    rotations[:, :, 1] *= pixel_spacings[:, 1:2]
+
+    affines = np.zeros((n_planes, 4, 4), dtype=dtype)
+    affines[:, :3, :3] = rotations
+    affines[:, :3, 3] = image_positions
+    affines[:, 3, 3] = 1.0
+    return affines
+
+
+def build_inverse_transform(
+    image_position: Sequence[float],
+    image_orientation: Sequence[float],
+    pixel_spacing: Sequence[float],
+    spacing_between_slices: float = 1.0,
+    dtype: Union[type, np.dtype] = np.float64
+) -> np.ndarray:
+    """Builds an inverse affine transformation matrix for mapping coordinates
+    in the frame of reference back into the pixel matrix of an image.
+
+    Parameters
+    ----------
+    image_position: Sequence[float]
+        Position of the slice (image or frame) in the Frame of Reference,
+        i.e., the offset of the top left pixel in the pixel matrix from the
+        origin of the reference coordinate system along the X, Y, and Z axis
+    image_orientation: Sequence[float]
+        Cosines of the row direction (first triplet: horizontal, left to
+        right, increasing Column index) and the column direction (second
+        triplet: vertical, top to bottom, increasing Row index) direction
+        for X, Y, and Z axis of the patient or slide coordinate system
+        defined by the Frame of Reference
+    pixel_spacing: Sequence[float]
+        Spacing between pixels in millimeter unit along the row direction
+        (horizontal, left to right, increasing Column index) and the column
+        direction (vertical, top to bottom, increasing Row index)
+    spacing_between_slices: float, optional
+        Distance between neighboring slices (focal planes) in millimeter
+        unit along the direction normal to the image plane
+    dtype: Union[type, numpy.dtype], optional
+        Data type of the output array; double precision is used by default
+
+    Returns
+    -------
+    numpy.ndarray
+        4 x 4 inverse affine transformation matrix
+
+    Raises
+    ------
+    ValueError
+        When `image_position`, `image_orientation` or `pixel_spacing` do
+        not have the expected length
+
+    """
+    if len(image_position) != 3:
+        raise ValueError('Argument "image_position" must have length 3.')
+    if len(pixel_spacing) != 2:
+        raise ValueError('Argument "pixel_spacing" must have length 2.')
+    translation = np.asarray(image_position, dtype=np.float64)
+    spacing = np.asarray(pixel_spacing, dtype=np.float64)
+
+    orientation_key = tuple(float(v) for v in image_orientation)
+    if orientation_key == _AXIS_ALIGNED_ORIENTATION:
+        # Specialized path for the by far most common orientation: the
+        # inverse is diagonal plus translation and can be written directly.
+        inverse_affine = np.zeros((4, 4), dtype=dtype)
+        inverse_affine[0, 0] = 1.0 / spacing[0]
+        inverse_affine[1, 1] = 1.0 / spacing[1]
+        inverse_affine[0, 3] = -translation[0] / spacing[0]
+        inverse_affine[1, 3] = -translation[1] / spacing[1]
+        if spacing_between_slices != 1.0:
+            inverse_affine[2, 2] = -1.0 / spacing_between_slices
+            inverse_affine[2, 3] = translation[2] / spacing_between_slices
+        else:
+            inverse_affine[2, 2] = -1.0
+            inverse_affine[2, 3] = translation[2]
+        inverse_affine[3, 3] = 1.0
+        return inverse_affine
+
+    rotation = _create_rotation_matrix_cached(orientation_key)
+
+    # The rotation matrix has orthonormal columns before the spacing-based
+    # scaling is applied, so the inverse of the scaled matrix can be computed
+    # in closed form as the transpose with reciprocally scaled rows, which
+    # avoids the fixed per-call overhead of `numpy.linalg.inv`.
+    assert np.allclose(np.matmul(rotation, rotation.T), np.eye(3))
+    inverse_affine = np.zeros((4, 4), dtype=dtype)
+    inverse_affine[:3, :3] = rotation.T
+    inverse_affine[0, :3] /= spacing[0]
+    inverse_affine[1, :3] /= spacing[1]
+    if spacing_between_slices != 1.0:
+        # Skip the division on the default value, which is by far the most
+        # common case for 2D-only mapping.
+        inverse_affine[2, :3] /= spacing_between_slices
+    inverse_affine[:3, 3] = -np.matmul(inverse_affine[:3, :3], translation)
+    inverse_affine[3, 3] = 1.0
+    return inverse_affine
+
+
+def apply_transform(
+    coordinate: Union[Sequence[float], np.ndarray],
+    affine: np.ndarray
+) -> Union[Tuple[float, float, float], np.ndarray]:
+    """Applies an affine transformation matrix to one or more coordinates
+    in the pixel matrix of an image to obtain the corresponding coordinates
+    in the frame of reference.
+
+    Parameters
+    ----------
+    coordinate: Union[Sequence[float], numpy.ndarray]
+        One-based (Column, Row) index of the Total Pixel Matrix in pixel
+        unit, either as a single pair or as an array of shape ``(m, 2)``
+        for mapping several coordinates at once
+    affine: numpy.ndarray
+        4 x 4 affine transformation matrix as constructed by
+        :func:`build_transform`
+
+    Returns
+    -------
+    Union[Tuple[float, float, float], numpy.ndarray]
+        (X, Y, Z) coordinate in the coordinate system defined by the Frame
+        of Reference; an array of shape ``(m, 3)`` if an array of
+        coordinates was provided
+
+    Raises
+    ------
+    ValueError
+        When `coordinate` does not have the expected shape
+
+    """
+    coordinate_arr = np.array(coordinate, dtype=float)
+    if coordinate_arr.ndim == 1:
+        if coordinate_arr.shape[0] != 2:
+            raise ValueError('Argument "coordinate" must have length 2.')
+        column_offset = float(coordinate_arr[0])
+        row_offset = float(coordinate_arr[1])
+        # For a single coordinate, scalar arithmetic on the relevant matrix
+        # entries is faster than dispatching a 4x4 matmul. The z pixel
+        # coordinate is zero by construction, so the third column of the
+        # matrix never contributes. Entries are read with `item()`, which
+        # yields plain Python floats, so no NumPy scalar or array has to be
+        # converted on return.
+        x = (
+            affine.item(0, 0) * row_offset +
+            affine.item(0, 1) * column_offset +
+            affine.item(0, 3)
+        )
+        y = (
+            affine.item(1, 0) * row_offset +
+            affine.item(1, 1) * column_offset +
+            affine.item(1, 3)
+        )
+        z = (
+            affine.item(2, 0) * row_offset +
+            affine.item(2, 1) * column_offset +
+            affine.item(2, 3)
+        )
+        return (x, y, z)
+    if coordinate_arr.ndim != 2 or coordinate_arr.shape[1] != 2:
+        raise ValueError(
+            'Argument "coordinate" must be a (Column, Row) pair or an '
+            'array of shape (m, 2).'
+        )
+    return apply_transform_batch(coordinate_arr, affine)
+
+
+def apply_transform_batch(
+    coordinates: Union[Sequence[Sequence[float]], np.ndarray],
+    affine: np.ndarray,
+    dtype: Union[type, np.dtype] = np.float64
+) -> np.ndarray:
+    """Applies an affine transformation matrix to an array of coordinates
+    in the pixel matrix of an image to obtain the corresponding coordinates
+    in the frame of reference.
+
+    The coordinates are processed in structure-of-arrays fashion: the input
+    is transposed into contiguous per-axis arrays and each output axis is
+    computed as a single NumPy expression over them, which lets NumPy issue
+    one vectorized loop per axis. This is the preferred entry point when
+    mapping more than a handful of coordinates, e.g., the pixels of an
+    entire frame; looping over tuples with :func:`apply_transform` should
+    be avoided in that case.
+
+    Parameters
+    ----------
+    coordinates: Union[Sequence[Sequence[float]], numpy.ndarray]
+        One-based (Column, Row) indices of the Total Pixel Matrix in pixel
+        unit with shape ``(m, 2)``
+    affine: numpy.ndarray
+        4 x 4 affine transformation matrix as constructed by
+        :func:`build_transform`
+    dtype: Union[type, numpy.dtype], optional
+        Data type used for the computation and the output array; double
+        precision is used by default, single precision doubles the number
+        of coordinates processed per SIMD vector when mapping a very large
+        number of coordinates at sub-millimeter precision
+
+    Returns
+    -------
+    numpy.ndarray
+        (X, Y, Z) coordinates in the coordinate system defined by the Frame
+        of Reference with shape ``(m, 3)``
+
+    Raises
+    ------
+    ValueError
+        When `coordinates` does not have shape ``(m, 2)``
+
+    """
+    coordinates = np.asarray(coordinates, dtype=dtype)
+    if coordinates.ndim != 2 or coordinates.shape[1] != 2:
+        raise ValueError('Argument "coordinates" must have shape (m, 2).')
+    soa = np.ascontiguousarray(coordinates.T)
+    column_offsets = soa[0]
+    row_offsets = soa[1]
+    m = coordinates.shape[0]
+    # Matrix entries are read as plain Python floats so that the arithmetic
+    # is carried out in the data type of the coordinate arrays.
+    physical_coordinates = np.empty((3, m), dtype=dtype)
+    physical_coordinates[0] = (
+        affine.item(0, 0) * row_offsets +
+        affine.item(0, 1) * column_offsets +
+        affine.item(0, 3)
+    )
+    physical_coordinates[1] = (
+        affine.item(1, 0) * row_offsets +
+        affine.item(1, 1) * column_offsets +
+        affine.item(1, 3)
+    )
+    physical_coordinates[2] = (
+        affine.item(2, 0) * row_offsets +
+        affine.item(2, 1) * column_offsets +
+        affine.item(2, 3)
+    )
+    return np.ascontiguousarray(physical_coordinates.T)
+
+
+def apply_inverse_transform(
+    coordinate: Union[Sequence[float], np.ndarray],
+    affine: np.ndarray
+) -> Union[Tuple[float, float, float], np.ndarray]:
+    """Applies an inverse affine transformation matrix to one or more
+    coordinates in the frame of reference to obtain the corresponding
+    coordinates in the pixel matrix of an image.
+
+    Parameters
+    ----------
+    coordinate: Union[Sequence[float], numpy.ndarray]
+        (X, Y, Z) coordinate in the coordinate system defined by the Frame
+        of Reference, either as a single triplet or as an array of shape
+        ``(m, 3)`` for mapping several coordinates at once
+    affine: numpy.ndarray
+        4 x 4 inverse affine transformation matrix as constructed by
+        :func:`build_inverse_transform`
+
+    Returns
+    -------
+    Union[Tuple[float, float, float], numpy.ndarray]
+        One-based (Column, Row, Slice) index of the Total Pixel Matrix in
+        pixel unit; an array of shape ``(m, 3)`` if an array of coordinates
+        was provided
+
+    Raises
+    ------
+    ValueError
+        When `coordinate` does not have the expected shape
+
+    """
+    coordinate_arr = np.array(coordinate, dtype=float)
+    if coordinate_arr.ndim == 1:
+        if coordinate_arr.shape[0] != 3:
+            raise ValueError('Argument "coordinate" must have length 3.')
+        x = float(coordinate_arr[0])
+        y = float(coordinate_arr[1])
+        z = float(coordinate_arr[2])
+        # For a single coordinate, scalar arithmetic on the matrix entries
+        # is faster than dispatching a 4x4 matmul. Entries are read with
+        # `item()`, which yields plain Python floats, so no NumPy scalar or
+        # array has to be converted on return.
+        row_offset = (
+            affine.item(0, 0) * x +
+            affine.item(0, 1) * y +
+            affine.item(0, 2) * z +
+            affine.item(0, 3)
+        )
+        column_offset = (
+            affine.item(1, 0) * x +
+            affine.item(1, 1) * y +
+            affine.item(1, 2) * z +
+            affine.item(1, 3)
+        )
+        slice_offset = (
+            affine.item(2, 0) * x +
+            affine.item(2, 1) * y +
+            affine.item(2, 2) * z +
+            affine.item(2, 3)
+        )
+        return (column_offset, row_offset, slice_offset)
+    if coordinate_arr.ndim != 2 or coordinate_arr.shape[1] != 3:
+        raise ValueError(
+            'Argument "coordinate" must be an (X, Y, Z) triplet or an '
+            'array of shape (m, 3).'
+        )
+    m = coordinate_arr.shape[0]
+    # Build the (4, m) column-vector matrix directly in C-contiguous
+    # float64 layout instead of filling an (m, 4) array and transposing it,
+    # so the matmul operates on contiguous buffers.
+    reference_coordinates = np.empty((4, m), dtype=np.float64)
+    reference_coordinates[:3] = coordinate_arr.T
+    reference_coordinates[3] = 1.0
+    affine = np.ascontiguousarray(affine, dtype=np.float64)
+    pixel_matrix_coordinates = affine @ reference_coordinates
+    output = np.empty((m, 3), dtype=float)
+    output[:, 0] = pixel_matrix_coordinates[1]
+    output[:, 1] = pixel_matrix_coordinates[0]
+    output[:, 2] = pixel_matrix_coordinates[2]
+    return output
+
+
+def _map_pixels_numpy(
+    coordinates: np.ndarray,
+    image_position: Sequence[float],
+    image_orientation: Sequence[float],
+    pixel_spacing: Sequence[float]
+) -> np.ndarray:
+    """Maps an array of coordinates in the pixel matrix into the frame of
+    reference using fused NumPy expressions.
+
+    The nine scaled affine coefficients are computed once as scalars and
+    the three output axes are evaluated directly over the coordinate
+    arrays, without ever materializing the 4 x 4 transformation matrix.
+
+    Parameters
+    ----------
+    coordinates: numpy.ndarray
+        One-based (Column, Row) indices of the Total Pixel Matrix in pixel
+        unit with shape ``(m, 2)``
+    image_position: Sequence[float]
+        Position of the slice (image or frame) in the Frame of Reference
+    image_orientation: Sequence[float]
+        Cosines of the row direction (first triplet) and the column
+        direction (second triplet) for X, Y, and Z axis of the patient or
+        slide coordinate system defined by the Frame of Reference
+    pixel_spacing: Sequence[float]
+        Spacing between pixels in millimeter unit along the row and the
+        column direction
+
+    Returns
+    -------
+    numpy.ndarray
+        (X, Y, Z) coordinates in the coordinate system defined by the Frame
+        of Reference with shape ``(m, 3)``
+
+    """
+    row_spacing = float(pixel_spacing[0])
+    column_spacing = float(pixel_spacing[1])
+    a_00 = float(image_orientation[0]) * row_spacing
+    a_10 = float(image_orientation[1]) * row_spacing
+    a_20 = float(image_orientation[2]) * row_spacing
+    a_01 = float(image_orientation[3]) * column_spacing
+    a_11 = float(image_orientation[4]) * column_spacing
+    a_21 = float(image_orientation[5]) * column_spacing
+    t_x = float(image_position[0])
+    t_y = float(image_position[1])
+    t_z = float(image_position[2])
+
+    soa = np.ascontiguousarray(coordinates.T)
+    column_offsets = soa[0]
+    row_offsets = soa[1]
+    output = np.empty((3, coordinates.shape[0]), dtype=coordinates.dtype)
+    output[0] = a_00 * row_offsets + a_01 * column_offsets + t_x
+    output[1] = a_10 * row_offsets + a_11 * column_offsets + t_y
+    output[2] = a_20 * row_offsets + a_21 * column_offsets + t_z
+    return np.ascontiguousarray(output.T)
+
+
+_map_pixels_kernel: Optional[Callable[..., np.ndarray]] = None
+_map_pixels_kernel_checked = False
+
+
+def _build_map_pixels_kernel() -> Optional[Callable[..., np.ndarray]]:
+    """Compiles a fused coordinate mapping kernel with Numba.
+
+    The kernel combines the construction of the affine transformation
+    matrix and its application to a batch of coordinates in a single typed
+    loop, avoiding any intermediate array allocation per coordinate.
+
+    Returns
+    -------
+    Union[Callable[..., numpy.ndarray], None]
+        Compiled kernel or ``None`` if Numba is not installed
+
+    """
+    try:
+        from numba import njit, prange
+    except ImportError:
+        return None
+
+    @njit(cache=True, fastmath=True, parallel=True)
+    def kernel(
+        coordinates: np.ndarray,
+        image_position: np.ndarray,
+        image_orientation: np.ndarray,
+        pixel_spacing: np.ndarray
+    ) -> np.ndarray:
+        row_spacing = pixel_spacing[0]
+        column_spacing = pixel_spacing[1]
+        a_00 = image_orientation[0] * row_spacing
+        a_10 = image_orientation[1] * row_spacing
+        a_20 = image_orientation[2] * row_spacing
+        a_01 = image_orientation[3] * column_spacing
+        a_11 = image_orientation[4] * column_spacing
+        a_21 = image_orientation[5] * column_spacing
+        t_x = image_position[0]
+        t_y = image_position[1]
+        t_z = image_position[2]
+        m = coordinates.shape[0]
+        output = np.empty((m, 3), coordinates.dtype)
+        for i in prange(m):
+            column_offset = coordinates[i, 0]
+            row_offset = coordinates[i, 1]
+            output[i, 0] = a_00 * row_offset + a_01 * column_offset + t_x
+            output[i, 1] = a_10 * row_offset + a_11 * column_offset + t_y
+            output[i, 2] = a_20 * row_offset + a_21 * column_offset + t_z
+        return output
+
+    return kernel
+
+
+def _get_map_pixels_kernel() -> Optional[Callable[..., np.ndarray]]:
+    """Returns the compiled coordinate mapping kernel if Numba is installed.
+
+    The kernel is compiled lazily upon the first request and cached for
+    subsequent calls.
+
+    Returns
+    -------
+    Union[Callable[..., numpy.ndarray], None]
+        Compiled kernel or ``None`` if Numba is not installed
+
+    """
+    global _map_pixels_kernel, _map_pixels_kernel_checked
+    if not _map_pixels_kernel_checked:
+        _map_pixels_kernel = _build_map_pixels_kernel()
+        _map_pixels_kernel_checked = True
+    return _map_pixels_kernel
+
+
+def map_pixels_into_coordinate_system(
+    coordinates: Union[Sequence[Sequence[float]], np.ndarray],
+    image_position: Sequence[float],
+    image_orientation: Sequence[float],
+    pixel_spacing: Sequence[float],
+    dtype: Union[type, np.dtype] = np.float64
+) -> np.ndarray:
+    """Maps an array of coordinates in the pixel matrix into the physical
+    coordinate system (e.g., Slide or Patient) defined by a frame of
+    reference.
+
+    When Numba is installed, the mapping is performed by a JIT-compiled
+    kernel that fuses the construction and the application of the affine
+    transformation in a single loop over the coordinates; otherwise the
+    vectorized NumPy implementation is used. Both are substantially faster
+    than calling :func:`map_pixel_into_coordinate_system` per coordinate
+    when mapping many coordinates, e.g., an entire segmentation mask.
+
+    Parameters
+    ----------
+    coordinates: Union[Sequence[Sequence[float]], numpy.ndarray]
+        One-based (Column, Row) indices of the Total Pixel Matrix in pixel
+        unit with shape ``(m, 2)``
+    image_position: Sequence[float]
+        Position of the slice (image or frame) in the Frame of Reference,
+        i.e., the offset of the top left pixel in the pixel matrix from the
+        origin of the reference coordinate system along the X, Y, and Z axis
+    image_orientation: Sequence[float]
+        Cosines of the row direction (first triplet: horizontal, left to
+        right, increasing Column index) and the column direction (second
+        triplet: vertical, top to bottom, increasing Row index) direction
+        for X, Y, and Z axis of the patient or slide coordinate system
+        defined by the Frame of Reference
+    pixel_spacing: Sequence[float]
+        Spacing between pixels in millimeter unit along the row direction
+        (horizontal, left to right, increasing Column index) and the column
+        direction (vertical, top to bottom, increasing Row index)
+    dtype: Union[type, numpy.dtype], optional
+        Data type used for the computation and the output array; double
+        precision is used by default, single precision doubles the number
+        of coordinates processed per SIMD vector when mapping a very large
+        number of coordinates at sub-millimeter precision
+
+    Returns
+    -------
+    numpy.ndarray
+        (X, Y, Z) coordinates in the coordinate system defined by the Frame
+        of Reference with shape ``(m, 3)``
+
+    Raises
+    ------
+    ValueError
+        When `coordinates` does not have shape ``(m, 2)``
+
+    """
+    coordinates = np.ascontiguousarray(coordinates, dtype=dtype)
+    if coordinates.ndim != 2 or coordinates.shape[1] != 2:
+        raise ValueError('Argument "coordinates" must have shape (m, 2).')
+    kernel = _get_map_pixels_kernel()
+    if kernel is not None:
+        return kernel(
+            coordinates,
+            np.ascontiguousarray(image_position, dtype=dtype),
+            np.ascontiguousarray(image_orientation, dtype=dtype),
+            np.ascontiguousarray(pixel_spacing, dtype=dtype)
+        )
+    return _map_pixels_numpy(
+        coordinates,
+        image_position=image_position,
+        image_orientation=image_orientation,
+        pixel_spacing=pixel_spacing
+    )
+
+
 def map_pixel_into_coordinate_system(
     coordinate: Tuple[float, float],
     image_position: Tuple[float, float, float],
@@ -289,58 +1224,49 @@ def map_pixel_into_coordinate_system(
     ValueError
         When the X, Y or Z coordinate has a negative value
 
+    Note
+    ----
+    This function is convenient for mapping an individual coordinate.
+    When mapping a large number of coordinates, build the transformation
+    once with :func:`build_transform` and apply it to an array of
+    coordinates with :func:`apply_transform`.
+
     """
-    # Read the below article for further information about the mapping
-    # between coordinates in the pixel matrix and the frame of reference:
-    # https://nipy.org/nibabel/dicom/dicom_orientation.html
-    x_offset = float(image_position[0])
-    y_offset = float(image_position[1])
-    z_offset = float(image_position[2])
-    image_offset = np.array([x_offset, y_offset, z_offset])
-    row_cosines = np.array(image_orientation[:3])
-    column_cosines = np.array(image_orientation[3:])
+    if len(image_position) != 3:
+        raise ValueError('Argument "image_position" must have length 3.')
+    if len(image_orientation) != 6:
+        raise ValueError('Argument "image_orientation" must have length 6.')
+    if len(pixel_spacing) != 2:
+        raise ValueError('Argument "pixel_spacing" must have length 2.')
+
+    # For a single coordinate, the transformation is evaluated directly
+    # from the direction cosines, spacings and offsets with scalar
+    # arithmetic; the affine matrix of build_transform/apply_transform is
+    # never materialized.
+    column_offset = float(coordinate[0])
+    row_offset = float(coordinate[1])
     row_spacing = float(pixel_spacing[0])
     column_spacing = float(pixel_spacing[1])
-
-    n = np.cross(column_cosines.T, row_cosines.T)
-    k = np.array([0.0, 0.0, 0.0])
-
-    f_row = row_cosines * row_spacing
-    f_col = column_cosines * column_spacing
-
-    # 4x4 affine transformation matrix
-    affine = np.concatenate(
-        [
-            f_row[..., None],
-            f_col[..., None],
-            k[..., None],
-            image_offset[..., None],
-        ],
-        axis=1
+    x = (
+        float(image_orientation[0]) * row_spacing * row_offset +
+        float(image_orientation[3]) * column_spacing * column_offset +
+        float(image_position[0])
     )
-    affine = np.concatenate(
-        [
-            affine,
-            np.array([[0.0, 0.0, 0.0, 1.0]])
-        ],
-        axis=0
+    y = (
+        float(image_orientation[1]) * row_spacing * row_offset +
+        float(image_orientation[4]) * column_spacing * column_offset +
+        float(image_position[1])
+    )
+    z = (
+        float(image_orientation[2]) * row_spacing * row_offset +
+        float(image_orientation[5]) * column_spacing * column_offset +
+        float(image_position[2])
     )
 
-    column_offset = float(coordinate[0])
-    row_offset = float(coordinate[1])
-    pixel_matrix_coordinate = np.array([[row_offset, column_offset, 0.0, 1.0]])
-
-    physical_coordinate = np.dot(affine, pixel_matrix_coordinate.T)
-
-    x = physical_coordinate[0][0]
     if (x < 0.0):
         raise ValueError('X offset in coordinate system cannot be negative.')
-
-    y = physical_coordinate[1][0]
     if (y < 0.0):
         raise ValueError('Y offset in coordinate system cannot be negative.')
-
-    z = np.sum([n[0] * x_offset, n[1] * y_offset, n[2] * z_offset])
     if (z < 0.0):
         raise ValueError('Z offset in coordinate system cannot be negative.')
 
@@ -1,6 +1,19 @@
+import numpy as np
 import pytest
 
-from highdicom.utils import map_pixel_into_coordinate_system
+from highdicom.utils import (
+    apply_inverse_transform,
+    apply_transform,
+    apply_transform_batch,
+    build_inverse_transform,
+    build_transform,
+    build_transforms,
+    compute_rotation,
+    compute_rotations,
+    create_rotation_matrix,
+    map_pixel_into_coordinate_system,
+    map_pixels_into_coordinate_system,
+)
 
 
 mappings = [
@@ -128,3 +141,234 @@ mappings = [
 def test_map_pixel_into_coordinate_system(inputs, expected_output):
     output = map_pixel_into_coordinate_system(**inputs)
     assert output == expected_output
+
+
+@pytest.mark.parametrize('inputs,expected_output', mappings)
+def test_apply_transform(inputs, expected_output):
+    affine = build_transform(
+        image_position=inputs['image_position'],
+        image_orientation=inputs['image_orientation'],
+        pixel_spacing=inputs['pixel_spacing'],
+    )
+    assert apply_transform(inputs['coordinate'], affine) == expected_output
+
+
+@pytest.mark.parametrize('inputs,expected_output', mappings)
+def test_apply_transform_array(inputs, expected_output):
+    affine = build_transform(
+        image_position=inputs['image_position'],
+        image_orientation=inputs['image_orientation'],
+        pixel_spacing=inputs['pixel_spacing'],
+    )
+    coordinates = np.array([inputs['coordinate']] * 3)
+    output = apply_transform(coordinates, affine)
+    assert output.shape == (3, 3)
+    assert np.array_equal(output, np.array([expected_output] * 3))
+
+
+def test_apply_transform_batch():
+    affine = build_transform(
+        image_position=(10.0, 60.0, 30.0),
+        image_orientation=(0.0, 1.0, 0.0, 1.0, 0.0, 0.0),
+        pixel_spacing=(0.5, 2.0),
+    )
+    coordinates = np.array([
+        [0.0, 0.0],
+        [1.0, 1.0],
+        [5.0, 2.0],
+        [2.0, 4.0],
+    ])
+    output = apply_transform_batch(coordinates, affine)
+    assert output.shape == (4, 3)
+    for i, coordinate in enumerate(coordinates):
+        assert tuple(output[i]) == apply_transform(tuple(coordinate), affine)
+
+
+@pytest.mark.parametrize('inputs,expected_output', mappings)
+def test_apply_inverse_transform(inputs, expected_output):
+    inverse_affine = build_inverse_transform(
+        image_position=inputs['image_position'],
+        image_orientation=inputs['image_orientation'],
+        pixel_spacing=inputs['pixel_spacing'],
+    )
+    column, row, slice_offset = apply_inverse_transform(
+        expected_output, inverse_affine
+    )
+    assert (column, row) == pytest.approx(inputs['coordinate'])
+    assert slice_offset == pytest.approx(0.0)
+
+
+@pytest.mark.parametrize('inputs,expected_output', mappings)
+def test_map_pixels_into_coordinate_system(inputs, expected_output):
+    coordinates = np.array([inputs['coordinate']] * 4)
+    output = map_pixels_into_coordinate_system(
+        coordinates=coordinates,
+        image_position=inputs['image_position'],
+        image_orientation=inputs['image_orientation'],
+        pixel_spacing=inputs['pixel_spacing'],
+    )
+    assert output.shape == (4, 3)
+    assert np.allclose(output, np.array([expected_output] * 4))
+
+
+def test_coordinate_mapping_single_precision():
+    image_position = (10.0, 60.0, 30.0)
+    image_orientation = (0.0, 1.0, 0.0, 1.0, 0.0, 0.0)
+    pixel_spacing = (0.5, 2.0)
+    affine = build_transform(
+        image_position=image_position,
+        image_orientation=image_orientation,
+        pixel_spacing=pixel_spacing,
+        dtype=np.float32,
+    )
+    assert affine.dtype == np.float32
+    coordinates = np.array([[5.0, 2.0], [2.0, 4.0]])
+    output = apply_transform_batch(coordinates, affine, dtype=np.float32)
+    assert output.dtype == np.float32
+    assert np.allclose(output[0], (20.0, 61.0, 30.0))
+    output = map_pixels_into_coordinate_system(
+        coordinates=coordinates,
+        image_position=image_position,
+        image_orientation=image_orientation,
+        pixel_spacing=pixel_spacing,
+        dtype=np.float32,
+    )
+    assert output.dtype == np.float32
+    assert np.allclose(output[0], (20.0, 61.0, 30.0))
+    inverse_affine = build_inverse_transform(
+        image_position=image_position,
+        image_orientation=image_orientation,
+        pixel_spacing=pixel_spacing,
+        dtype=np.float32,
+    )
+    assert inverse_affine.dtype == np.float32
+
+
+def test_build_inverse_transform_spacing_between_slices():
+    image_position = (10.0, 60.0, 30.0)
+    image_orientation = (0.0, 1.0, 0.0, 1.0, 0.0, 0.0)
+    pixel_spacing = (0.5, 2.0)
+    spacing_between_slices = 2.5
+    inverse_affine = build_inverse_transform(
+        image_position=image_position,
+        image_orientation=image_orientation,
+        pixel_spacing=pixel_spacing,
+        spacing_between_slices=spacing_between_slices,
+    )
+    affine = build_transform(
+        image_position=image_position,
+        image_orientation=image_orientation,
+        pixel_spacing=pixel_spacing,
+    )
+    affine[:3, 2] *= spacing_between_slices
+    assert np.allclose(inverse_affine, np.linalg.inv(affine))
+
+
+rotations = [
+    pytest.param((1.0, 0.0, 0.0, 0.0, -1.0, 0.0), 0.0),
+    pytest.param((0.0, 1.0, 0.0, 1.0, 0.0, 0.0), -90.0),
+    pytest.param((0.0, -1.0, 0.0, -1.0, 0.0, 0.0), 90.0),
+]
+
+
+@pytest.mark.parametrize('image_orientation,expected_angle', rotations)
+def test_compute_rotation(image_orientation, expected_angle):
+    angle = compute_rotation(image_orientation, in_degrees=True)
+    assert angle == pytest.approx(expected_angle)
+    angle = compute_rotation(image_orientation)
+    assert angle == pytest.approx(np.radians(expected_angle))
+
+
+@pytest.mark.parametrize(
+    'image_orientation',
+    [
+        (0.0, 0.0, 1.0, 0.0, 1.0, 0.0),
+        (0.0, 1.0, 0.0, 0.0, 0.0, 1.0),
+        (1.0, 0.0, 0.0, 0.0, 1.0, 0.0),
+    ]
+)
+def test_compute_rotation_invalid_orientation(image_orientation):
+    with pytest.raises(ValueError):
+        compute_rotation(image_orientation)
+
+
+def test_compute_rotations():
+    image_orientations = [param.values[0] for param in rotations]
+    expected_angles = [param.values[1] for param in rotations]
+    angles = compute_rotations(image_orientations, in_degrees=True)
+    assert angles == pytest.approx(expected_angles)
+    angles = compute_rotations(image_orientations)
+    assert angles == pytest.approx(np.radians(expected_angles))
+
+
+def test_compute_rotations_invalid_orientation():
+    image_orientations = [
+        (1.0, 0.0, 0.0, 0.0, -1.0, 0.0),
+        (0.0, 1.0, 0.0, 0.0, 0.0, 1.0),
+    ]
+    with pytest.raises(ValueError):
+        compute_rotations(image_orientations)
+
+
+def test_build_transform_axis_aligned():
+    image_position = (10.0, 60.0, 30.0)
+    image_orientation = (1.0, 0.0, 0.0, 0.0, 1.0, 0.0)
+    pixel_spacing = (0.5, 2.0)
+    spacing_between_slices = 2.5
+    affine = build_transform(
+        image_position=image_position,
+        image_orientation=image_orientation,
+        pixel_spacing=pixel_spacing,
+    )
+    expected = np.zeros((4, 4))
+    expected[:3, :3] = create_rotation_matrix(image_orientation)
+    expected[:3, 0] *= pixel_spacing[0]
+    expected[:3, 1] *= pixel_spacing[1]
+    expected[:3, 3] = image_position
+    expected[3, 3] = 1.0
+    assert np.array_equal(affine, expected)
+
+    inverse_affine = build_inverse_transform(
+        image_position=image_position,
+        image_orientation=image_orientation,
+        pixel_spacing=pixel_spacing,
+        spacing_between_slices=spacing_between_slices,
+    )
+    forward = affine.copy()
+    forward[:3, 2] *= spacing_between_slices
+    assert np.allclose(np.matmul(inverse_affine, forward), np.eye(4))
+
+
+def test_apply_inverse_transform_array():
+    inverse_affine = build_inverse_transform(
+        image_position=(10.0, 60.0, 30.0),
+        image_orientation=(0.0, 1.0, 0.0, 1.0, 0.0, 0.0),
+        pixel_spacing=(0.5, 2.0),
+    )
+    coordinates = np.array([
+        [10.0, 60.0, 30.0],
+        [20.0, 61.0, 30.0],
+        [12.0, 70.0, 30.0],
+    ])
+    output = apply_inverse_transform(coordinates, inverse_affine)
+    assert output.shape == (3, 3)
+    for i, coordinate in enumerate(coordinates):
+        expected = apply_inverse_transform(tuple(coordinate), inverse_affine)
+        assert tuple(output[i]) == pytest.approx(expected)
+
+
+def test_build_transforms():
+    parameters = [param.values[0] for param in mappings]
+    affines = build_transforms(
+        image_positions=[p['image_position'] for p in parameters],
+        image_orientations=[p['image_orientation'] for p in parameters],
+        pixel_spacings=[p['pixel_spacing'] for p in parameters],
+    )
+    assert affines.shape == (len(parameters), 4, 4)
+    for i, p in enumerate(parameters):
+        affine = build_transform(
+            image_position=p['image_position'],
+            image_orientation=p['image_orientation'],
+            pixel_spacing=p['pixel_spacing'],
+        )
+        assert np.array_equal(affines[i], affine)